@@ -5,6 +5,7 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
+from orjson import loads as json_loads
 from tenacity import after_log, retry, retry_if_exception_type, wait_fixed
 
 from botli_dataclasses import API_Challenge_Reponse, Challenge_Request
@@ -82,8 +83,8 @@ class API:
                                                  data={'rated': str(challenge_request.rated).lower(),
                                                        'clock.limit': challenge_request.initial_time,
                                                        'clock.increment': challenge_request.increment,
-                                                       'color': challenge_request.color.value,
-                                                       'variant': challenge_request.variant.value,
+                                                       'color': challenge_request.color,
+                                                       'variant': challenge_request.variant,
                                                        'keepAliveStream': 'true'},
                                                  timeout=aiohttp.ClientTimeout(sock_read=60.0)) as response:
 
@@ -95,7 +96,7 @@ class API:
                     if not line.strip():
                         continue
 
-                    data: dict[str, Any] = json.loads(line)
+                    data: dict[str, Any] = json_loads(line)
                     yield API_Challenge_Reponse(data.get('id', None),
                                                 data.get('done') == 'accepted',
                                                 data.get('error'),
@@ -112,7 +113,7 @@ class API:
     async def decline_challenge(self, challenge_id: str, reason: Decline_Reason) -> bool:
         try:
             async with self.lichess_session.post(f'/api/challenge/{challenge_id}/decline',
-                                                 data={'reason': reason.value}) as response:
+                                                 data={'reason': reason}) as response:
                 response.raise_for_status()
                 return True
         except aiohttp.ClientResponseError as e:
@@ -146,7 +147,7 @@ class API:
     async def get_cloud_eval(self, fen: str, variant: Variant, timeout: int) -> dict[str, Any] | None:
         try:
             async with self.lichess_session.get('/api/cloud-eval', params={'fen': fen,
-                                                                           'variant': variant.value},
+                                                                           'variant': variant},
                                                 timeout=aiohttp.ClientTimeout(total=timeout)) as response:
                 response.raise_for_status()
                 return await response.json()
@@ -174,20 +175,20 @@ class API:
                                             timeout=aiohttp.ClientTimeout(sock_read=9.0)) as response:
             async for line in response.content:
                 if line.strip():
-                    await queue.put(json.loads(line))
+                    await queue.put(json_loads(line))
 
     @retry(**GAME_STREAM_RETRY_CONDITIONS)
     async def get_game_stream(self, game_id: str, queue: asyncio.Queue[dict[str, Any]]) -> None:
         async with self.lichess_session.get(f'/api/bot/game/stream/{game_id}',
                                             timeout=aiohttp.ClientTimeout(sock_read=9.0)) as response:
             async for line in response.content:
-                await queue.put(json.loads(line) if line.strip() else {'type': 'ping'})
+                await queue.put(json_loads(line) if line.strip() else {'type': 'ping'})
 
     @retry(**JSON_RETRY_CONDITIONS)
     async def get_online_bots(self) -> list[dict[str, Any]]:
         async with self.lichess_session.get('/api/bot/online',
                                             timeout=aiohttp.ClientTimeout(sock_read=9.0)) as response:
-            return [json.loads(line) async for line in response.content if line.strip()]
+            return [json_loads(line) async for line in response.content if line.strip()]
 
     async def get_opening_explorer(self,
                                    username: str,
@@ -199,14 +200,14 @@ class API:
                                    ) -> dict[str, Any] | None:
         try:
             async with self.external_session.get('https://explorer.lichess.ovh/player',
-                                                 params={'player': username, 'variant': variant.value,
+                                                 params={'player': username, 'variant': variant,
                                                          'fen': fen, 'color': color, 'speeds': speeds,
                                                          'modes': 'rated', 'recentGames': 0},
                                                  timeout=aiohttp.ClientTimeout(total=timeout)) as response:
                 response.raise_for_status()
                 async for line in response.content:
                     if line.strip():
-                        return json.loads(line)
+                        return json_loads(line)
         except (aiohttp.ClientError, json.JSONDecodeError) as e:
             print(f'Explore: {e}')
         except TimeoutError:
@@ -7,7 +7,12 @@ from enums import Decline_Reason
 class Challenge_Validator:
     def __init__(self, config: Config) -> None:
         self.config = config
-        self.time_controls = self._get_time_controls(self.config.challenge.time_controls)
+        self.variants = set(config.challenge.variants)
+        self.speeds = set(config.challenge.time_controls)
+        self.time_controls = self._get_time_controls(config.challenge.time_controls)
+        self.bot_modes = set(config.challenge.bot_modes)
+        self.human_modes = set(config.challenge.human_modes)
+        self.bullet_with_increment_only = config.challenge.bullet_with_increment_only
         self.min_increment = 0 if config.challenge.min_increment is None else config.challenge.min_increment
         self.max_increment = 180 if config.challenge.max_increment is None else config.challenge.max_increment
         self.min_initial = 0 if config.challenge.min_initial is None else config.challenge.min_initial
@@ -20,7 +25,7 @@ class Challenge_Validator:
             return Decline_Reason.TIME_CONTROL
 
         variant: str = challenge_event['variant']['key']
-        if variant not in self.config.challenge.variants:
+        if variant not in self.variants:
             print(f'Variant "{variant}" is not allowed according to config.')
             return Decline_Reason.VARIANT
 
@@ -31,13 +36,13 @@ class Challenge_Validator:
             print('Challenger is blacklisted.')
             return Decline_Reason.GENERIC
 
-        if not (self.config.challenge.bot_modes or self.config.challenge.human_modes):
+        if not (self.bot_modes or self.human_modes):
             print('Neither bots nor humans are allowed according to config.')
             return Decline_Reason.GENERIC
 
         is_bot: bool = challenge_event['challenger']['title'] == 'BOT'
-        modes = self.config.challenge.bot_modes if is_bot else self.config.challenge.human_modes
-        if modes is None:
+        modes = self.bot_modes if is_bot else self.human_modes
+        if not modes:
             if is_bot:
                 print('Bots are not allowed according to config.')
                 return Decline_Reason.NO_BOT
@@ -47,11 +52,11 @@ class Challenge_Validator:
 
         increment: int = challenge_event['timeControl']['increment']
         initial: int = challenge_event['timeControl']['limit']
-        if not self.config.challenge.time_controls:
+        if not self.speeds:
             print('No time control is allowed according to config.')
             return Decline_Reason.GENERIC
 
-        if speed not in self.config.challenge.time_controls and (initial, increment) not in self.time_controls:
+        if speed not in self.speeds and (initial, increment) not in self.time_controls:
             print(f'Time control "{speed}" is not allowed according to config.')
             return Decline_Reason.TIME_CONTROL
 
@@ -71,7 +76,7 @@ class Challenge_Validator:
             print(f'Initial time {initial} is too long according to config.')
             return Decline_Reason.TOO_SLOW
 
-        if is_bot and speed == 'bullet' and increment == 0 and self.config.challenge.bullet_with_increment_only:
+        if is_bot and speed == 'bullet' and increment == 0 and self.bullet_with_increment_only:
             print('Bullet against bots is only allowed with increment according to config.')
             return Decline_Reason.TOO_FAST
 
@@ -85,11 +90,11 @@ class Challenge_Validator:
             print('Casual is not allowed according to config.')
             return Decline_Reason.RATED
 
-    def _get_time_controls(self, speeds: list[str]) -> list[tuple[int, int]]:
-        time_controls: list[tuple[int, int]] = []
+    def _get_time_controls(self, speeds: list[str]) -> set[tuple[int, int]]:
+        time_controls: set[tuple[int, int]] = set()
         for speed in speeds:
             if '+' in speed:
                 initial_str, increment_str = speed.split('+')
-                time_controls.append((int(initial_str) * 60, int(increment_str)))
+                time_controls.add((int(initial_str) * 60, int(increment_str)))
 
         return time_controls
@@ -1,7 +1,12 @@
+import functools
+import json
 import os
 import os.path
+import re
+import stat
 import subprocess
 import sys
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,8 +17,125 @@ from configs import (Books_Config, Challenge_Config, ChessDB_Config, Engine_Conf
                      Offer_Draw_Config, Online_EGTB_Config, Online_Moves_Config, Opening_Books_Config,
                      Opening_Explorer_Config, Resign_Config, Syzygy_Config)
 
-
-@dataclass
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+DISALLOWED_MESSAGES = frozenset({'!printeval'})
+TC_PATTERN = re.compile(r'\s*(\d+\.?\d*|\.\d+)?\s*\+\s*(\d+)?\s*')
+
+# (section, type, error message)
+SECTIONS = (
+    ('token', str, '`token` must be a string wrapped in quotes.'),
+    ('engines', dict, '`engines` must be a dictionary with indented keys followed by colons.'),
+    ('syzygy', dict, '`syzygy` must be a dictionary with indented keys followed by colons.'),
+    ('gaviota', dict, '`gaviota` must be a dictionary with indented keys followed by colons.'),
+    ('opening_books', dict, '`opening_books` must be a dictionary with indented keys followed by colons.'),
+    ('online_moves', dict, '`online_moves` must be a dictionary with indented keys followed by colons.'),
+    ('offer_draw', dict, '`offer_draw` must be a dictionary with indented keys followed by colons.'),
+    ('resign', dict, '`resign` must be a dictionary with indented keys followed by colons.'),
+    ('challenge', dict, '`challenge` must be a dictionary with indented keys followed by colons.'),
+    ('matchmaking', dict, '`matchmaking` must be a dictionary with indented keys followed by colons.'),
+    ('messages', (dict, type(None)), '`messages` must be a dictionary with indented keys followed by colons.'),
+    ('books', dict, '`books` must be a dictionary with indented keys followed by colons.'))
+
+ENGINES_SECTIONS = (
+    ('dir', str, '"dir" must be a string wrapped in quotes.'),
+    ('name', str, '"name" must be a string wrapped in quotes.'),
+    ('ponder', bool, '"ponder" must be a bool.'),
+    ('silence_stderr', bool, '"silence_stderr" must be a bool.'),
+    ('uci_options', (dict, type(None)), '"uci_options" must be a dictionary with indented keys followed by colons.'))
+
+ENABLED_SECTIONS = (
+    ('enabled', bool, '"enabled" must be a bool.'),)
+
+SYZYGY_SECTIONS = (
+    ('paths', list, '"paths" must be a list.'),
+    ('max_pieces', int, '"max_pieces" must be an integer.'),
+    ('instant_play', bool, '"instant_play" must be a bool.'))
+
+GAVIOTA_SECTIONS = (
+    ('paths', list, '"paths" must be a list.'),
+    ('max_pieces', int, '"max_pieces" must be an integer.'))
+
+OPENING_BOOKS_SECTIONS = (
+    ('priority', int, '"priority" must be an integer.'),
+    ('books', dict, '"books" must be a dictionary with indented keys followed by colons.'))
+
+OPENING_BOOK_TYPES_SECTIONS = (
+    ('selection', str, '"selection" must be one of "weighted_random", "uniform_random" or "best_move".'),
+    ('names', list, '"names" must be a list of book names.'))
+
+OPENING_EXPLORER_SECTIONS = (
+    ('priority', int, '"priority" must be an integer.'),
+    ('use_for_variants', bool, '"use_for_variants" must be a bool.'),
+    ('min_time', int, '"min_time" must be an integer.'),
+    ('timeout', int, '"timeout" must be an integer.'),
+    ('min_games', int, '"min_games" must be an integer.'),
+    ('only_with_wins', bool, '"only_with_wins" must be a bool.'),
+    ('selection', str, '"selection" must be "performance" or "win_rate".'),
+    ('anti', bool, '"anti" must be a bool.'))
+
+LICHESS_CLOUD_SECTIONS = (
+    ('priority', int, '"priority" must be an integer.'),
+    ('only_without_book', bool, '"only_without_book" must be a bool.'),
+    ('min_eval_depth', int, '"min_eval_depth" must be an integer.'),
+    ('min_time', int, '"min_time" must be an integer.'),
+    ('timeout', int, '"timeout" must be an integer.'))
+
+CHESSDB_SECTIONS = (
+    ('priority', int, '"priority" must be an integer.'),
+    ('min_time', int, '"min_time" must be an integer.'),
+    ('timeout', int, '"timeout" must be an integer.'),
+    ('selection', str, '"selection" must be one of "optimal", "best" or "good".'))
+
+ONLINE_EGTB_SECTIONS = (
+    ('min_time', int, '"min_time" must be an integer.'),
+    ('timeout', int, '"timeout" must be an integer.'))
+
+ONLINE_MOVES_SECTIONS = (
+    ('opening_explorer', dict, ('"opening_explorer" must be a dictionary '
+                                'with indented keys followed by colons.')),
+    ('chessdb', dict, '"chessdb" must be a dictionary with indented keys followed by colons.'),
+    ('lichess_cloud', dict, '"lichess_cloud" must be a dictionary with indented keys followed by colons.'),
+    ('online_egtb', dict, '"online_egtb" must be a dictionary with indented keys followed by colons.'))
+
+OFFER_DRAW_SECTIONS = (
+    ('enabled', bool, '"enabled" must be a bool.'),
+    ('score', int, '"score" must be an integer.'),
+    ('consecutive_moves', int, '"consecutive_moves" must be an integer.'),
+    ('min_game_length', int, '"min_game_length" must be an integer.'),
+    ('against_humans', bool, '"against_humans" must be a bool.'))
+
+RESIGN_SECTIONS = (
+    ('enabled', bool, '"enabled" must be a bool.'),
+    ('score', int, '"score" must be an integer.'),
+    ('consecutive_moves', int, '"consecutive_moves" must be an integer.'),
+    ('against_humans', bool, '"against_humans" must be a bool.'))
+
+CHALLENGE_SECTIONS = (
+    ('concurrency', int, '"concurrency" must be an integer.'),
+    ('bullet_with_increment_only', bool, '"bullet_with_increment_only" must be a bool.'),
+    ('variants', list, '"variants" must be a list of variants.'),
+    ('time_controls', (list, type(None)), '"time_controls" must be a list of speeds or time controls.'),
+    ('bot_modes', (list, type(None)), '"bot_modes" must be a list of game modes.'),
+    ('human_modes', (list, type(None)), '"human_modes" must be a list of game modes.'))
+
+MATCHMAKING_SECTIONS = (
+    ('delay', int, '"delay" must be an integer.'),
+    ('timeout', int, '"timeout" must be an integer.'),
+    ('selection', str, '"selection" must be "weighted_random" or "sequential".'),
+    ('types', dict, '"types" must be a dictionary with indented keys followed by colons.'))
+
+MESSAGES_SECTIONS = (
+    ('greeting', str, '"greeting" must be a string wrapped in quotes.'),
+    ('goodbye', str, '"goodbye" must be a string wrapped in quotes.'),
+    ('greeting_spectators', str, '"greeting_spectators" must be a string wrapped in quotes.'),
+    ('goodbye_spectators', str, '"goodbye_spectators" must be a string wrapped in quotes.'))
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     url: str
     token: str
@@ -27,15 +149,21 @@ class Config:
     challenge: Challenge_Config
     matchmaking: Matchmaking_Config
     messages: Messages_Config
-    whitelist: list[str]
-    blacklist: list[str]
-    version: str
+    whitelist: set[str]
+    blacklist: set[str]
+
+    @property
+    def version(self) -> str:
+        return Config._get_version()
 
     @classmethod
     def from_yaml(cls, yaml_path: str) -> 'Config':
-        with open(yaml_path, encoding='utf-8') as yaml_input:
+        with open(yaml_path, 'rb') as yaml_input:
             try:
-                yaml_config = yaml.safe_load(yaml_input)
+                if yaml_path.endswith('.json'):
+                    yaml_config = json.load(yaml_input)
+                else:
+                    yaml_config = yaml.load(yaml_input, Loader=SafeLoader)
             except Exception as e:
                 print(f'There appears to be a syntax problem with your {yaml_path}', file=sys.stderr)
                 raise e
@@ -43,7 +171,7 @@ class Config:
         if 'token' not in yaml_config and 'LICHESS_BOT_TOKEN' in os.environ:
             yaml_config['token'] = os.environ['LICHESS_BOT_TOKEN']
 
-        cls._check_sections(yaml_config)
+        cls._check_fields(yaml_config, SECTIONS, 'section')
 
         engine_configs = cls._get_engine_configs(yaml_config['engines'])
         syzygy_config = cls._get_syzygy_configs(yaml_config['syzygy'])
@@ -54,9 +182,9 @@ class Config:
         resign_config = cls._get_resign_config(yaml_config['resign'])
         challenge_config = cls._get_challenge_config(yaml_config['challenge'])
         matchmaking_config = cls._get_matchmaking_config(yaml_config['matchmaking'])
-        messages_config = cls._get_messages_config(yaml_config['messages'] or {})
-        whitelist = [string.lower() for string in yaml_config.get('whitelist') or []]
-        blacklist = [string.lower() for string in yaml_config.get('blacklist') or []]
+        messages_config = cls._get_messages_config(yaml_config['messages'])
+        whitelist = set(map(str.lower, yaml_config.get('whitelist') or []))
+        blacklist = set(map(str.lower, yaml_config.get('blacklist') or []))
 
         return cls(yaml_config.get('url', 'https://lichess.org'),
                    yaml_config['token'],
@@ -71,196 +199,168 @@ class Config:
                    matchmaking_config,
                    messages_config,
                    whitelist,
-                   blacklist,
-                   cls._get_version())
+                   blacklist)
 
     @staticmethod
-    def _check_sections(config: dict[str, Any]) -> None:
-        # [section, type, error message]
-        sections = [
-            ['token', str, 'Section `token` must be a string wrapped in quotes.'],
-            ['engines', dict, 'Section `engines` must be a dictionary with indented keys followed by colons.'],
-            ['syzygy', dict, 'Section `syzygy` must be a dictionary with indented keys followed by colons.'],
-            ['gaviota', dict, 'Section `gaviota` must be a dictionary with indented keys followed by colons.'],
-            ['opening_books', dict, ('Section `opening_books` must be a dictionary '
-                                     'with indented keys followed by colons.')],
-            ['online_moves', dict, ('Section `online_moves` must be a dictionary '
-                                    'with indented keys followed by colons.')],
-            ['offer_draw', dict, 'Section `offer_draw` must be a dictionary with indented keys followed by colons.'],
-            ['resign', dict, 'Section `resign` must be a dictionary with indented keys followed by colons.'],
-            ['challenge', dict, 'Section `challenge` must be a dictionary with indented keys followed by colons.'],
-            ['matchmaking', dict, 'Section `matchmaking` must be a dictionary with indented keys followed by colons.'],
-            ['messages', dict | None, 'Section `messages` must be a dictionary with indented keys followed by colons.'],
-            ['books', dict, 'Section `books` must be a dictionary with indented keys followed by colons.']]
-        for section in sections:
-            if section[0] not in config:
-                raise RuntimeError(f'Your config does not have required section `{section[0]}`.')
-
-            if not isinstance(config[section[0]], section[1]):
-                raise TypeError(section[2])
+    def _check_fields(section: dict[str, Any], schema: tuple[tuple[str, Any, str], ...], location: str) -> None:
+        for name, field_type, error_message in schema:
+            if name not in section:
+                raise RuntimeError(f'Your config does not have required {location} `{name}`.')
+
+            if section[name] is None and isinstance(field_type, tuple):
+                section[name] = field_type[0]()
+            elif not isinstance(section[name], field_type):
+                raise TypeError(f'{location[0].upper()}{location[1:]} {error_message}')
 
     @staticmethod
     def _get_engine_configs(engines_section: dict[str, dict[str, Any]]) -> dict[str, Engine_Config]:
-        engines_sections = [
-            ['dir', str, '"dir" must be a string wrapped in quotes.'],
-            ['name', str, '"name" must be a string wrapped in quotes.'],
-            ['ponder', bool, '"ponder" must be a bool.'],
-            ['silence_stderr', bool, '"silence_stderr" must be a bool.'],
-            ['uci_options', dict | None, '"uci_options" must be a dictionary with indented keys followed by colons.']]
-
-        engine_configs: dict[str, Engine_Config] = {}
-        for key, settings in engines_section.items():
-            for subsection in engines_sections:
-                if subsection[0] not in settings:
-                    raise RuntimeError(f'Your "{key}" engine does not have required field `{subsection[0]}`.')
-
-                if not isinstance(settings[subsection[0]], subsection[1]):
-                    raise TypeError(f'`engines` `{key}` subsection {subsection[2]}')
+        return {key: Config._get_engine_config(key, settings) for key, settings in engines_section.items()}
 
-            if not os.path.isdir(settings['dir']):
-                raise RuntimeError(f'Your engine dir "{settings["dir"]}" is not a directory.')
+    @staticmethod
+    def _get_engine_config(key: str, settings: dict[str, Any]) -> Engine_Config:
+        Config._check_fields(settings, ENGINES_SECTIONS, f'`engines` `{key}` subsection')
 
-            settings['path'] = os.path.join(settings['dir'], settings['name'])
+        settings['path'] = os.path.join(settings['dir'], settings['name'])
 
-            if not os.path.isfile(settings['path']):
-                raise RuntimeError(f'The engine "{settings["path"]}" file does not exist.')
+        try:
+            is_file = stat.S_ISREG(os.stat(settings['path']).st_mode)
+        except OSError:
+            is_file = False
 
-            if not os.access(settings['path'], os.X_OK):
-                raise RuntimeError(f'The engine "{settings["path"]}" doesnt have execute (x) permission. '
-                                   f'Try: chmod +x {settings["path"]}')
+        if not is_file:
+            if not os.path.isdir(settings['dir']):
+                raise RuntimeError(f'Your engine dir "{settings["dir"]}" is not a directory.')
+
+            raise RuntimeError(f'The engine "{settings["path"]}" file does not exist.')
 
-            engine_configs[key] = Engine_Config(settings['path'],
-                                                settings['ponder'],
-                                                settings['silence_stderr'],
-                                                settings.get('move_overhead_multiplier'),
-                                                settings['uci_options'] or {})
+        if not os.access(settings['path'], os.X_OK):
+            raise RuntimeError(f'The engine "{settings["path"]}" doesnt have execute (x) permission. '
+                               f'Try: chmod +x {settings["path"]}')
 
-        return engine_configs
+        return Engine_Config(settings['path'],
+                             settings['ponder'],
+                             settings['silence_stderr'],
+                             settings.get('move_overhead_multiplier'),
+                             settings['uci_options'])
 
     @staticmethod
     def _get_syzygy_configs(syzygy_section: dict[str, dict[str, Any]]) -> dict[str, Syzygy_Config]:
-        syzygy_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['paths', list, '"paths" must be a list.'],
-            ['max_pieces', int, '"max_pieces" must be an integer.'],
-            ['instant_play', bool, '"instant_play" must be a bool.']]
-
-        syzygy_configs: dict[str, Syzygy_Config] = {}
-        for key, settings in syzygy_section.items():
-            for subsection in syzygy_sections:
-                if subsection[0] not in settings:
-                    raise RuntimeError('Your config does not have required '
-                                       f'`syzygy` `{key}` subsection `{subsection[0]}`.')
-
-                if not isinstance(settings[subsection[0]], subsection[1]):
-                    raise TypeError(f'`syzygy` `{key}` subsection {subsection[2]}')
-
-            if not settings['enabled']:
-                syzygy_configs[key] = Syzygy_Config(False, [], 0, False)
-                continue
+        return {key: Config._get_syzygy_config(key, settings) for key, settings in syzygy_section.items()}
 
-            for path in settings['paths']:
-                if not os.path.isdir(path):
-                    raise RuntimeError(f'Your {key} syzygy path "{path}" is not a directory.')
+    @staticmethod
+    def _get_syzygy_config(key: str, settings: dict[str, Any]) -> Syzygy_Config:
+        Config._check_fields(settings, ENABLED_SECTIONS, f'`syzygy` `{key}` subsection')
 
-            syzygy_configs[key] = Syzygy_Config(settings['enabled'],
-                                                settings['paths'],
-                                                settings['max_pieces'],
-                                                settings['instant_play'])
+        if not settings['enabled']:
+            return Syzygy_Config(False, (), 0, False)
 
-        return syzygy_configs
+        Config._check_fields(settings, SYZYGY_SECTIONS, f'`syzygy` `{key}` subsection')
+
+        try:
+            paths = tuple(map(os.fspath, settings['paths']))
+        except TypeError as e:
+            raise TypeError(f'`syzygy` `{key}` subsection "paths" must be a list of strings.') from e
+
+        for path in paths:
+            if not os.path.isdir(path):
+                raise RuntimeError(f'Your {key} syzygy path "{path}" is not a directory.')
+
+        return Syzygy_Config(True, paths, settings['max_pieces'], settings['instant_play'])
 
     @staticmethod
     def _get_gaviota_config(gaviota_section: dict[str, Any]) -> Gaviota_Config:
-        gaviota_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['paths', list, '"paths" must be a list.'],
-            ['max_pieces', int, '"max_pieces" must be an integer.']]
+        Config._check_fields(gaviota_section, ENABLED_SECTIONS, '`gaviota` subsection')
 
-        for subsection in gaviota_sections:
-            if subsection[0] not in gaviota_section:
-                raise RuntimeError(f'Your config does not have required `gaviota` subsection `{subsection[0]}`.')
+        if not gaviota_section['enabled']:
+            return Gaviota_Config(False, (), 0)
 
-            if not isinstance(gaviota_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`gaviota` subsection {subsection[2]}')
+        Config._check_fields(gaviota_section, GAVIOTA_SECTIONS, '`gaviota` subsection')
 
-        if gaviota_section['enabled']:
-            for path in gaviota_section['paths']:
-                if not os.path.isdir(path):
-                    raise RuntimeError(f'Your gaviota directory "{path}" is not a directory.')
+        try:
+            paths = tuple(map(os.fspath, gaviota_section['paths']))
+        except TypeError as e:
+            raise TypeError('`gaviota` subsection "paths" must be a list of strings.') from e
+
+        for path in paths:
+            if not os.path.isdir(path):
+                raise RuntimeError(f'Your gaviota directory "{path}" is not a directory.')
 
-        return Gaviota_Config(gaviota_section['enabled'], gaviota_section['paths'], gaviota_section['max_pieces'])
+        return Gaviota_Config(True, paths, gaviota_section['max_pieces'])
 
     @staticmethod
     def _get_opening_books_config(config: dict[str, Any]) -> Opening_Books_Config:
-        opening_books_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['priority', int, '"priority" must be an integer.'],
-            ['books', dict, '"books" must be a dictionary with indented keys followed by colons.']]
-
-        for subsection in opening_books_sections:
-            if subsection[0] not in config['opening_books']:
-                raise RuntimeError(f'Your config does not have required `opening_books` subsection `{subsection[0]}`.')
+        opening_books_section = config['opening_books']
+        Config._check_fields(opening_books_section, ENABLED_SECTIONS, '`opening_books` subsection')
 
-            if not isinstance(config['opening_books'][subsection[0]], subsection[1]):
-                raise TypeError(f'`opening_books` subsection {subsection[2]}')
-
-        if not config['opening_books']['enabled']:
+        if not opening_books_section['enabled']:
             return Opening_Books_Config(False, 0, None, {})
 
-        opening_book_types_sections = [
-            ['selection', str, '"selection" must be one of "weighted_random", "uniform_random" or "best_move".'],
-            ['names', list, '"names" must be a list of book names.']]
+        Config._check_fields(opening_books_section, OPENING_BOOKS_SECTIONS, '`opening_books` subsection')
+
+        books_section = config['books']
+        books = {section: Config._get_books_config(section, settings, books_section)
+                 for section, settings in opening_books_section['books'].items()}
+        existing_books = Config._get_existing_files({path
+                                                     for books_config in books.values()
+                                                     for path in books_config.names.values()})
+        for books_config in books.values():
+            for book_name, path in books_config.names.items():
+                if path not in existing_books:
+                    raise RuntimeError(f'The book "{book_name}" at "{path}" does not exist.')
+
+        return Opening_Books_Config(True,
+                                    opening_books_section['priority'],
+                                    opening_books_section.get('read_learn'),
+                                    books)
 
-        books: dict[str, Books_Config] = {}
-        for section, settings in config['opening_books']['books'].items():
-            for subsection in opening_book_types_sections:
-                if subsection[0] not in settings:
-                    raise RuntimeError(f'Your `opening_books` `books` `{section}` section'
-                                       f'does not have required field `{subsection[0]}`.')
+    @staticmethod
+    def _get_books_config(section: str, settings: dict[str, Any], books_section: dict[str, str]) -> Books_Config:
+        Config._check_fields(settings, OPENING_BOOK_TYPES_SECTIONS, f'`opening_books` `books` `{section}` field')
 
-                if not isinstance(settings[subsection[0]], subsection[1]):
-                    raise TypeError(f'`opening_books` `books` `{section}` field {subsection[2]}')
+        names: dict[str, str] = {}
+        for book_name in settings['names']:
+            if (path := books_section.get(book_name)) is None:
+                raise RuntimeError(f'The book "{book_name}" is not defined in the books section.')
 
-            names: dict[str, str] = {}
-            for book_name in settings['names']:
-                if book_name not in config['books']:
-                    raise RuntimeError(f'The book "{book_name}" is not defined in the books section.')
+            names[book_name] = path
 
-                if not os.path.isfile(config['books'][book_name]):
-                    raise RuntimeError(f'The book "{book_name}" at "{config["books"][book_name]}" does not exist.')
+        return Books_Config(settings['selection'], settings.get('max_depth'), names)
 
-                names[book_name] = config['books'][book_name]
+    @staticmethod
+    def _get_existing_files(paths: Iterable[str]) -> set[str]:
+        paths_by_dir: dict[str, list[str]] = {}
+        for path in paths:
+            paths_by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+        existing_files: set[str] = set()
+        for directory, dir_paths in paths_by_dir.items():
+            if len(dir_paths) == 1:
+                if os.path.isfile(dir_paths[0]):
+                    existing_files.add(dir_paths[0])
+                continue
 
-            books[section] = Books_Config(settings['selection'], settings.get('max_depth'), names)
+            try:
+                with os.scandir(directory or '.') as entries:
+                    file_names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                file_names = set()
 
-        return Opening_Books_Config(config['opening_books']['enabled'],
-                                    config['opening_books']['priority'],
-                                    config['opening_books'].get('read_learn'),
-                                    books)
+            existing_files.update(path for path in dir_paths
+                                  if os.path.basename(path) in file_names or os.path.isfile(path))
+
+        return existing_files
 
     @staticmethod
     def _get_opening_explorer_config(opening_explorer_section: dict[str, Any]) -> Opening_Explorer_Config:
-        opening_explorer_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['priority', int, '"priority" must be an integer.'],
-            ['use_for_variants', bool, '"use_for_variants" must be a bool.'],
-            ['min_time', int, '"min_time" must be an integer.'],
-            ['timeout', int, '"timeout" must be an integer.'],
-            ['min_games', int, '"min_games" must be an integer.'],
-            ['only_with_wins', bool, '"only_with_wins" must be a bool.'],
-            ['selection', str, '"selection" must be "performance" or "win_rate".'],
-            ['anti', bool, '"anti" must be a bool.']]
-
-        for subsection in opening_explorer_sections:
-            if subsection[0] not in opening_explorer_section:
-                raise RuntimeError('Your config does not have required '
-                                   f'`online_moves` `opening_explorer` field `{subsection[0]}`.')
-
-            if not isinstance(opening_explorer_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`online_moves` `opening_explorer` field {subsection[2]}')
-
-        return Opening_Explorer_Config(opening_explorer_section['enabled'],
+        Config._check_fields(opening_explorer_section, ENABLED_SECTIONS, '`online_moves` `opening_explorer` field')
+
+        if not opening_explorer_section['enabled']:
+            return Opening_Explorer_Config(False, 0, False, 0, 0, 0, False, 'performance', False, None, None)
+
+        Config._check_fields(opening_explorer_section, OPENING_EXPLORER_SECTIONS,
+                             '`online_moves` `opening_explorer` field')
+
+        return Opening_Explorer_Config(True,
                                        opening_explorer_section['priority'],
                                        opening_explorer_section['use_for_variants'],
                                        opening_explorer_section['min_time'],
@@ -274,23 +374,14 @@ class Config:
 
     @staticmethod
     def _get_lichess_cloud_config(lichess_cloud_section: dict[str, Any]) -> Lichess_Cloud_Config:
-        lichess_cloud_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['priority', int, '"priority" must be an integer.'],
-            ['only_without_book', bool, '"only_without_book" must be a bool.'],
-            ['min_eval_depth', int, '"min_eval_depth" must be an integer.'],
-            ['min_time', int, '"min_time" must be an integer.'],
-            ['timeout', int, '"timeout" must be an integer.']]
-
-        for subsection in lichess_cloud_sections:
-            if subsection[0] not in lichess_cloud_section:
-                raise RuntimeError('Your config does not have required '
-                                   f'`online_moves` `lichess_cloud` field `{subsection[0]}`.')
-
-            if not isinstance(lichess_cloud_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`online_moves` `lichess_cloud` field {subsection[2]}')
-
-        return Lichess_Cloud_Config(lichess_cloud_section['enabled'],
+        Config._check_fields(lichess_cloud_section, ENABLED_SECTIONS, '`online_moves` `lichess_cloud` field')
+
+        if not lichess_cloud_section['enabled']:
+            return Lichess_Cloud_Config(False, 0, False, 0, 0, 0, None, None)
+
+        Config._check_fields(lichess_cloud_section, LICHESS_CLOUD_SECTIONS, '`online_moves` `lichess_cloud` field')
+
+        return Lichess_Cloud_Config(True,
                                     lichess_cloud_section['priority'],
                                     lichess_cloud_section['only_without_book'],
                                     lichess_cloud_section['min_eval_depth'],
@@ -301,22 +392,14 @@ class Config:
 
     @staticmethod
     def _get_chessdb_config(chessdb_section: dict[str, Any]) -> ChessDB_Config:
-        chessdb_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['priority', int, '"priority" must be an integer.'],
-            ['min_time', int, '"min_time" must be an integer.'],
-            ['timeout', int, '"timeout" must be an integer.'],
-            ['selection', str, '"selection" must be one of "optimal", "best" or "good".']]
-
-        for subsection in chessdb_sections:
-            if subsection[0] not in chessdb_section:
-                raise RuntimeError('Your config does not have required '
-                                   f'`online_moves` `chessdb` field `{subsection[0]}`.')
-
-            if not isinstance(chessdb_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`online_moves` `chessdb` field {subsection[2]}')
-
-        return ChessDB_Config(chessdb_section['enabled'],
+        Config._check_fields(chessdb_section, ENABLED_SECTIONS, '`online_moves` `chessdb` field')
+
+        if not chessdb_section['enabled']:
+            return ChessDB_Config(False, 0, 0, 0, 'optimal', None, None)
+
+        Config._check_fields(chessdb_section, CHESSDB_SECTIONS, '`online_moves` `chessdb` field')
+
+        return ChessDB_Config(True,
                               chessdb_section['priority'],
                               chessdb_section['min_time'],
                               chessdb_section['timeout'],
@@ -326,39 +409,20 @@ class Config:
 
     @staticmethod
     def _get_online_egtb_config(online_egtb_section: dict[str, Any]) -> Online_EGTB_Config:
-        online_egtb_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['min_time', int, '"min_time" must be an integer.'],
-            ['timeout', int, '"timeout" must be an integer.']]
+        Config._check_fields(online_egtb_section, ENABLED_SECTIONS, '`online_moves` `online_egtb` field')
 
-        for subsection in online_egtb_sections:
-            if subsection[0] not in online_egtb_section:
-                raise RuntimeError('Your config does not have required '
-                                   f'`online_moves` `online_egtb` field `{subsection[0]}`.')
+        if not online_egtb_section['enabled']:
+            return Online_EGTB_Config(False, 0, 0)
 
-            if not isinstance(online_egtb_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`online_moves` `online_egtb` field {subsection[2]}')
+        Config._check_fields(online_egtb_section, ONLINE_EGTB_SECTIONS, '`online_moves` `online_egtb` field')
 
-        return Online_EGTB_Config(online_egtb_section['enabled'],
+        return Online_EGTB_Config(True,
                                   online_egtb_section['min_time'],
                                   online_egtb_section['timeout'])
 
     @staticmethod
     def _get_online_moves_config(online_moves_section: dict[str, dict[str, Any]]) -> Online_Moves_Config:
-        online_moves_sections = [
-            ['opening_explorer', dict, ('"opening_explorer" must be a dictionary '
-                                        'with indented keys followed by colons.')],
-            ['chessdb', dict, '"chessdb" must be a dictionary with indented keys followed by colons.'],
-            ['lichess_cloud', dict, '"lichess_cloud" must be a dictionary with indented keys followed by colons.'],
-            ['online_egtb', dict, '"online_egtb" must be a dictionary with indented keys followed by colons.']]
-
-        for subsection in online_moves_sections:
-            if subsection[0] not in online_moves_section:
-                raise RuntimeError('Your config does not have required '
-                                   f'`online_moves` subsection `{subsection[0]}`.')
-
-            if not isinstance(online_moves_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`online_moves` subsection {subsection[2]}')
+        Config._check_fields(online_moves_section, ONLINE_MOVES_SECTIONS, '`online_moves` subsection')
 
         return Online_Moves_Config(Config._get_opening_explorer_config(online_moves_section['opening_explorer']),
                                    Config._get_lichess_cloud_config(online_moves_section['lichess_cloud']),
@@ -367,19 +431,7 @@ class Config:
 
     @staticmethod
     def _get_offer_draw_config(offer_draw_section: dict[str, Any]) -> Offer_Draw_Config:
-        offer_draw_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['score', int, '"score" must be an integer.'],
-            ['consecutive_moves', int, '"consecutive_moves" must be an integer.'],
-            ['min_game_length', int, '"min_game_length" must be an integer.'],
-            ['against_humans', bool, '"against_humans" must be a bool.']]
-
-        for subsection in offer_draw_sections:
-            if subsection[0] not in offer_draw_section:
-                raise RuntimeError(f'Your config does not have required `offer_draw` subsection `{subsection[0]}`.')
-
-            if not isinstance(offer_draw_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`offer_draw` subsection {subsection[2]}')
+        Config._check_fields(offer_draw_section, OFFER_DRAW_SECTIONS, '`offer_draw` subsection')
 
         return Offer_Draw_Config(offer_draw_section['enabled'],
                                  offer_draw_section['score'],
@@ -389,18 +441,7 @@ class Config:
 
     @staticmethod
     def _get_resign_config(resign_section: dict[str, Any]) -> Resign_Config:
-        resign_sections = [
-            ['enabled', bool, '"enabled" must be a bool.'],
-            ['score', int, '"score" must be an integer.'],
-            ['consecutive_moves', int, '"consecutive_moves" must be an integer.'],
-            ['against_humans', bool, '"against_humans" must be a bool.']]
-
-        for subsection in resign_sections:
-            if subsection[0] not in resign_section:
-                raise RuntimeError(f'Your config does not have required `resign` subsection `{subsection[0]}`.')
-
-            if not isinstance(resign_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`resign` subsection {subsection[2]}')
+        Config._check_fields(resign_section, RESIGN_SECTIONS, '`resign` subsection')
 
         return Resign_Config(resign_section['enabled'],
                              resign_section['score'],
@@ -409,20 +450,7 @@ class Config:
 
     @staticmethod
     def _get_challenge_config(challenge_section: dict[str, Any]) -> Challenge_Config:
-        challenge_sections = [
-            ['concurrency', int, '"concurrency" must be an integer.'],
-            ['bullet_with_increment_only', bool, '"bullet_with_increment_only" must be a bool.'],
-            ['variants', list, '"variants" must be a list of variants.'],
-            ['time_controls', list | None, '"time_controls" must be a list of speeds or time controls.'],
-            ['bot_modes', list | None, '"bot_modes" must be a list of game modes.'],
-            ['human_modes', list | None, '"human_modes" must be a list of game modes.']]
-
-        for subsection in challenge_sections:
-            if subsection[0] not in challenge_section:
-                raise RuntimeError(f'Your config does not have required `challenge` subsection `{subsection[0]}`.')
-
-            if not isinstance(challenge_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`challenge` subsection {subsection[2]}')
+        Config._check_fields(challenge_section, CHALLENGE_SECTIONS, '`challenge` subsection')
 
         return Challenge_Config(challenge_section['concurrency'],
                                 challenge_section['bullet_with_increment_only'],
@@ -431,67 +459,56 @@ class Config:
                                 challenge_section.get('min_initial'),
                                 challenge_section.get('max_initial'),
                                 challenge_section['variants'],
-                                challenge_section['time_controls'] or [],
-                                challenge_section['bot_modes'] or [],
-                                challenge_section['human_modes'] or [])
+                                challenge_section['time_controls'],
+                                challenge_section['bot_modes'],
+                                challenge_section['human_modes'])
 
     @staticmethod
     def _get_matchmaking_config(matchmaking_section: dict[str, Any]) -> Matchmaking_Config:
-        matchmaking_sections = [
-            ['delay', int, '"delay" must be an integer.'],
-            ['timeout', int, '"timeout" must be an integer.'],
-            ['selection', str, '"selection" must be "weighted_random" or "sequential".'],
-            ['types', dict, '"types" must be a dictionary with indented keys followed by colons.']]
-
-        for subsection in matchmaking_sections:
-            if subsection[0] not in matchmaking_section:
-                raise RuntimeError(f'Your config does not have required `matchmaking` subsection `{subsection[0]}`.')
-
-            if not isinstance(matchmaking_section[subsection[0]], subsection[1]):
-                raise TypeError(f'`matchmaking` subsection {subsection[2]}')
-
-        types: dict[str, Matchmaking_Type_Config] = {}
-        for matchmaking_type, matchmaking_options in matchmaking_section['types'].items():
-            if not isinstance(matchmaking_options, dict):
-                raise TypeError(f'`matchmaking` `types` subsection "{matchmaking_type}" must be a dictionary with '
-                                'indented keys followed by colons.')
-
-            if 'tc' not in matchmaking_options:
-                raise RuntimeError(f'Your matchmaking type "{matchmaking_type}" does not have required `tc` field.')
-
-            if not isinstance(matchmaking_options['tc'], str):
-                raise TypeError(f'`matchmaking` `types` `{matchmaking_type}` field `tc` must be a string in '
-                                'initial_minutes+increment_seconds format.')
-
-            types[matchmaking_type] = Matchmaking_Type_Config(matchmaking_options['tc'],
-                                                              matchmaking_options.get('rated'),
-                                                              matchmaking_options.get('variant'),
-                                                              matchmaking_options.get('weight'),
-                                                              matchmaking_options.get('multiplier'),
-                                                              matchmaking_options.get('min_rating_diff'),
-                                                              matchmaking_options.get('max_rating_diff'))
+        Config._check_fields(matchmaking_section, MATCHMAKING_SECTIONS, '`matchmaking` subsection')
 
         return Matchmaking_Config(matchmaking_section['delay'],
                                   matchmaking_section['timeout'],
                                   matchmaking_section['selection'],
-                                  types)
+                                  {matchmaking_type: Config._get_matchmaking_type_config(matchmaking_type, options)
+                                   for matchmaking_type, options in matchmaking_section['types'].items()})
+
+    @staticmethod
+    def _get_matchmaking_type_config(matchmaking_type: str, matchmaking_options: Any) -> Matchmaking_Type_Config:
+        if not isinstance(matchmaking_options, dict):
+            raise TypeError(f'`matchmaking` `types` subsection "{matchmaking_type}" must be a dictionary with '
+                            'indented keys followed by colons.')
+
+        if 'tc' not in matchmaking_options:
+            raise RuntimeError(f'Your matchmaking type "{matchmaking_type}" does not have required `tc` field.')
+
+        if not isinstance(matchmaking_options['tc'], str) or \
+                not (tc_match := TC_PATTERN.fullmatch(matchmaking_options['tc'])):
+            raise TypeError(f'`matchmaking` `types` `{matchmaking_type}` field `tc` must be a string in '
+                            'initial_minutes+increment_seconds format.')
+
+        initial_time, increment = tc_match.groups()
+        return Matchmaking_Type_Config(int(float(initial_time) * 60) if initial_time else 0,
+                                       int(increment) if increment else 0,
+                                       matchmaking_options.get('rated'),
+                                       matchmaking_options.get('variant'),
+                                       matchmaking_options.get('weight'),
+                                       matchmaking_options.get('multiplier'),
+                                       matchmaking_options.get('min_rating_diff'),
+                                       matchmaking_options.get('max_rating_diff'))
 
     @staticmethod
-    def _get_messages_config(messages_section: dict[str, str]) -> Messages_Config:
-        messages_sections = [
-            ['greeting', str, '"greeting" must be a string wrapped in quotes.'],
-            ['goodbye', str, '"goodbye" must be a string wrapped in quotes.'],
-            ['greeting_spectators', str, '"greeting_spectators" must be a string wrapped in quotes.'],
-            ['goodbye_spectators', str, '"goodbye_spectators" must be a string wrapped in quotes.']]
-
-        for subsection in messages_sections:
-            if subsection[0] in messages_section:
-                if not isinstance(messages_section[subsection[0]], subsection[1]):
-                    raise TypeError(f'`messages` subsection {subsection[2]}')
-
-                if messages_section[subsection[0]].strip() == '!printeval':
-                    print(f'Ignoring message "{subsection[0]}": "!printeval" is not allowed in messages.')
-                    del messages_section[messages_section[subsection[0]]]
+    def _get_messages_config(messages_section: dict[str, str | None]) -> Messages_Config:
+        for name, field_type, error_message in MESSAGES_SECTIONS:
+            if (message := messages_section.get(name)) is None:
+                continue
+
+            if not isinstance(message, field_type):
+                raise TypeError(f'`messages` subsection {error_message}')
+
+            if '!' in message and (command := message.strip()) in DISALLOWED_MESSAGES:
+                print(f'Ignoring message "{name}": "{command}" is not allowed in messages.')
+                messages_section[name] = None
 
         return Messages_Config(messages_section.get('greeting'),
                                messages_section.get('goodbye'),
@@ -499,13 +516,12 @@ class Config:
                                messages_section.get('goodbye_spectators'))
 
     @staticmethod
+    @functools.cache
     def _get_version() -> str:
         try:
             output = subprocess.check_output(['git', 'show', '-s', '--date=format:%Y%m%d',
-                                              '--format=%cd', 'HEAD'], stderr=subprocess.DEVNULL)
-            commit_date = output.decode('utf-8').strip()
-            output = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL)
-            commit_SHA = output.decode('utf-8').strip()[:7]
-            return f'{commit_date}-{commit_SHA}'
+                                              '--format=%cd-%H', 'HEAD'], stderr=subprocess.DEVNULL)
+            commit_date, commit_SHA = output.decode('utf-8').strip().split('-')
+            return f'{commit_date}-{commit_SHA[:7]}'
         except (FileNotFoundError, subprocess.CalledProcessError):
             return 'nogit'
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Engine_Config:
     path: str
     ponder: bool
@@ -11,29 +11,29 @@ class Engine_Config:
     uci_options: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Syzygy_Config:
     enabled: bool
-    paths: list[str]
+    paths: tuple[str, ...]
     max_pieces: int
     instant_play: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Gaviota_Config:
     enabled: bool
-    paths: list[str]
+    paths: tuple[str, ...]
     max_pieces: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Books_Config:
     selection: Literal['weighted_random', 'uniform_random', 'best_move']
     max_depth: int | None
     names: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Opening_Books_Config:
     enabled: bool
     priority: int
@@ -41,7 +41,7 @@ class Opening_Books_Config:
     books: dict[str, Books_Config]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Opening_Explorer_Config:
     enabled: bool
     priority: int
@@ -56,7 +56,7 @@ class Opening_Explorer_Config:
     max_moves: int | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Lichess_Cloud_Config:
     enabled: bool
     priority: int
@@ -68,7 +68,7 @@ class Lichess_Cloud_Config:
     max_moves: int | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChessDB_Config:
     enabled: bool
     priority: int
@@ -79,14 +79,14 @@ class ChessDB_Config:
     max_moves: int | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Online_EGTB_Config:
     enabled: bool
     min_time: int
     timeout: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Online_Moves_Config:
     opening_explorer: Opening_Explorer_Config
     lichess_cloud: Lichess_Cloud_Config
@@ -94,7 +94,7 @@ class Online_Moves_Config:
     online_egtb: Online_EGTB_Config
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Offer_Draw_Config:
     enabled: bool
     score: int
@@ -103,7 +103,7 @@ class Offer_Draw_Config:
     against_humans: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Resign_Config:
     enabled: bool
     score: int
@@ -111,7 +111,7 @@ class Resign_Config:
     against_humans: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Challenge_Config:
     concurrency: int
     bullet_with_increment_only: bool
@@ -125,9 +125,10 @@ class Challenge_Config:
     human_modes: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Matchmaking_Type_Config:
-    tc: str
+    initial_time: int
+    increment: int
     rated: bool | None
     variant: Literal['standard', 'chess960', 'crazyhouse', 'antichess', 'atomic',
                      'horde', 'kingOfTheHill', 'racingKings', 'threeCheck'] | None
@@ -137,7 +138,7 @@ class Matchmaking_Type_Config:
     max_rating_diff: int | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Matchmaking_Config:
     delay: int
     timeout: int
@@ -145,7 +146,7 @@ class Matchmaking_Config:
     types: dict[str, Matchmaking_Type_Config]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Messages_Config:
     greeting: str | None
     goodbye: str | None
@@ -7,6 +7,8 @@ import chess.engine
 
 from configs import Engine_Config, Syzygy_Config
 
+MANAGED_OPTIONS = frozenset(chess.engine.MANAGED_OPTIONS)
+
 
 class Engine:
     def __init__(self,
@@ -18,6 +20,7 @@ class Engine:
         self.engine = engine
         self.ponder = ponder
         self.opponent = opponent
+        self.ponder_analysis: chess.engine.AnalysisResult | None = None
 
     @classmethod
     async def from_config(cls,
@@ -38,7 +41,7 @@ class Engine:
         stderr = subprocess.DEVNULL if engine_config.silence_stderr else None
 
         transport, engine = await chess.engine.popen_uci(engine_config.path, stderr=stderr)
-        await cls._configure_engine(engine, engine_config, Syzygy_Config(False, [], 0, False))
+        await cls._configure_engine(engine, engine_config, Syzygy_Config(False, (), 0, False))
         result = await engine.play(chess.Board(), chess.engine.Limit(time=0.1), info=chess.engine.INFO_ALL)
 
         if not result.move:
@@ -51,23 +54,23 @@ class Engine:
     async def _configure_engine(engine: chess.engine.UciProtocol,
                                 engine_config: Engine_Config,
                                 syzygy_config: Syzygy_Config) -> None:
+        options: dict[str, chess.engine.ConfigValue] = {}
         for name, value in engine_config.uci_options.items():
-            if chess.engine.Option(name, '', None, None, None, None).is_managed():
+            if name.lower() in MANAGED_OPTIONS:
                 print(f'UCI option "{name}" ignored as it is managed by the bot.')
             elif name in engine.options:
-                await engine.configure({name: value})
+                options[name] = value
             else:
                 print(f'UCI option "{name}" ignored as it is not supported by the engine.')
 
-        if not syzygy_config.enabled:
-            return
+        if syzygy_config.enabled:
+            if 'SyzygyPath' in engine.options and 'SyzygyPath' not in engine_config.uci_options:
+                options['SyzygyPath'] = os.pathsep.join(syzygy_config.paths)
 
-        if 'SyzygyPath' in engine.options and 'SyzygyPath' not in engine_config.uci_options:
-            delimiter = ';' if os.name == 'nt' else ':'
-            await engine.configure({'SyzygyPath': delimiter.join(syzygy_config.paths)})
+            if 'SyzygyProbeLimit' in engine.options and 'SyzygyProbeLimit' not in engine_config.uci_options:
+                options['SyzygyProbeLimit'] = syzygy_config.max_pieces
 
-        if 'SyzygyProbeLimit' in engine.options and 'SyzygyProbeLimit' not in engine_config.uci_options:
-            await engine.configure({'SyzygyProbeLimit': syzygy_config.max_pieces})
+        await engine.configure(options)
 
     @property
     def name(self) -> str:
@@ -87,6 +90,7 @@ class Engine:
                                        black_clock=black_time, black_inc=increment)
             ponder = self.ponder
 
+        self.ponder_analysis = None
         result = await self.engine.play(board, limit, info=chess.engine.INFO_ALL, ponder=ponder)
 
         if not result.move:
@@ -96,12 +100,16 @@ class Engine:
 
     async def start_pondering(self, board: chess.Board) -> None:
         if self.ponder:
-            await self.engine.analysis(board)
+            self.ponder_analysis = await self.engine.analysis(board)
 
     async def stop_pondering(self, board: chess.Board) -> None:
         if self.ponder:
             self.ponder = False
-            await self.engine.analysis(board, chess.engine.Limit(time=0.001))
+            if self.ponder_analysis:
+                self.ponder_analysis.stop()
+                self.ponder_analysis = None
+            else:
+                await self.engine.analysis(board, chess.engine.Limit(time=0.001))
 
     async def close(self) -> None:
         try:
@@ -22,19 +22,20 @@ class Event_Handler:
         while event := await event_queue.get():
             match event['type']:
                 case 'challenge':
-                    if event['challenge']['challenger']['name'] == self.username:
+                    challenge = event['challenge']
+                    challenger_name = challenge['challenger']['name']
+                    if challenger_name == self.username:
                         continue
 
-                    self.last_challenge_event = event['challenge']
-                    self._print_challenge_event(event['challenge'])
+                    self.last_challenge_event = challenge
+                    self._print_challenge_event(challenge)
 
-                    if decline_reason := self.challenge_validator.get_decline_reason(event['challenge']):
+                    if decline_reason := self.challenge_validator.get_decline_reason(challenge):
                         print(128 * '‾')
-                        await self.api.decline_challenge(event['challenge']['id'], decline_reason)
+                        await self.api.decline_challenge(challenge['id'], decline_reason)
                         continue
 
-                    self.game_manager.add_challenge(Challenge(event['challenge']['id'],
-                                                              event['challenge']['challenger']['name']))
+                    self.game_manager.add_challenge(Challenge(challenge['id'], challenger_name))
                     print('Challenge added to queue.')
                     print(128 * '‾')
                 case 'gameStart':
@@ -49,12 +50,13 @@ class Event_Handler:
 
                     print(f'{opponent_name} declined challenge: {event["challenge"]["declineReason"]}')
                 case 'challengeCanceled':
-                    if event['challenge']['challenger']['name'] == self.username:
+                    challenge = event['challenge']
+                    challenger_name = challenge['challenger']['name']
+                    if challenger_name == self.username:
                         continue
 
-                    self.game_manager.remove_challenge(Challenge(event['challenge']['id'],
-                                                                 event['challenge']['challenger']['name']))
-                    self._print_challenge_event(event['challenge'])
+                    self.game_manager.remove_challenge(Challenge(challenge['id'], challenger_name))
+                    self._print_challenge_event(challenge)
                     print('Challenge has been canceled.')
                     print(128 * '‾')
                 case _:
@@ -62,10 +64,11 @@ class Event_Handler:
 
     def _print_challenge_event(self, challenge_event: dict[str, Any]) -> None:
         id_str = f'ID: {challenge_event["id"]}'
-        title = challenge_event['challenger'].get('title') or ''
-        name = challenge_event['challenger']['name']
-        rating = challenge_event['challenger']['rating']
-        provisional = '?' if challenge_event['challenger'].get('provisional') else ''
+        challenger = challenge_event['challenger']
+        title = challenger.get('title') or ''
+        name = challenger['name']
+        rating = challenger['rating']
+        provisional = '?' if challenger.get('provisional') else ''
         challenger_str = f'Challenger: {title}{" " if title else ""}{name} ({rating}{provisional})'
         tc_str = f'TC: {challenge_event["timeControl"].get("show", "Correspondence")}'
         rated_str = 'Rated' if challenge_event['rated'] else 'Casual'
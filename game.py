@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, timedelta
+import time
 from typing import Any
 
 from api import API
@@ -40,21 +40,22 @@ class Game:
 
         opponent_title = info.black_title if lichess_game.is_white else info.white_title
         abortion_seconds = 30.0 if opponent_title == 'BOT' else 60.0
-        abortion_time = datetime.now() + timedelta(seconds=abortion_seconds)
+        abortion_deadline = time.monotonic() + abortion_seconds
 
         while event := await game_stream_queue.get():
-            if event['type'] not in ['gameFull', 'gameState']:
-                if lichess_game.is_abortable and datetime.now() >= abortion_time:
+            event_type = event['type']
+            if event_type not in ('gameFull', 'gameState'):
+                if lichess_game.is_abortable and time.monotonic() >= abortion_deadline:
                     print('Aborting game ...')
                     await self.api.abort_game(self.game_id)
                     await chatter.send_abortion_message()
 
-                if event['type'] == 'chatLine':
+                if event_type == 'chatLine':
                     await chatter.handle_chat_message(event)
 
                 continue
 
-            if event['type'] == 'gameFull':
+            if event_type == 'gameFull':
                 event = event['state']
 
             lichess_game.update(event)
@@ -133,7 +133,7 @@ class Lichess_Game:
             case 'atomic':
                 return config.syzygy['atomic']
             case _:
-                return Syzygy_Config(False, [], 0, False)
+                return Syzygy_Config(False, (), 0, False)
 
     async def make_move(self) -> Lichess_Move:
         for move_source in self.move_sources:
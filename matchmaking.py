@@ -64,7 +64,7 @@ class Matchmaking:
         match await self._get_busy_reason(opponent):
             case Busy_Reason.PLAYING:
                 rating_diff = opponent.rating_diffs[self.current_type.perf_type]
-                print(f'Skipping {opponent.username} ({rating_diff:+}) as {color.value} ...')
+                print(f'Skipping {opponent.username} ({rating_diff:+}) as {color} ...')
                 self.opponents.skip_bot()
                 return
 
@@ -74,7 +74,7 @@ class Matchmaking:
                 return
 
         rating_diff = opponent.rating_diffs[self.current_type.perf_type]
-        print(f'Challenging {opponent.username} ({rating_diff:+}) as {color.value} to {self.current_type.name} ...')
+        print(f'Challenging {opponent.username} ({rating_diff:+}) as {color} to {self.current_type.name} ...')
         challenge_request = Challenge_Request(opponent.username, self.current_type.initial_time,
                                               self.current_type.increment, self.current_type.rated, color,
                                               self.current_type.variant, self.timeout)
@@ -115,19 +115,17 @@ class Matchmaking:
     def _get_init_types(self) -> list[Matchmaking_Type]:
         matchmaking_types: list[Matchmaking_Type] = []
         for name, type_config in self.config.matchmaking.types.items():
-            initial_time, increment = type_config.tc.split('+')
-            initial_time = int(float(initial_time) * 60) if initial_time else 0
-            increment = int(increment) if increment else 0
             rated = True if type_config.rated is None else type_config.rated
             variant = Variant.STANDARD if type_config.variant is None else Variant(type_config.variant)
-            perf_type = self._variant_to_perf_type(variant, initial_time, increment)
+            perf_type = self._variant_to_perf_type(variant, type_config.initial_time, type_config.increment)
             multiplier = 15 if type_config.multiplier is None else type_config.multiplier
             weight = 1.0 if type_config.weight is None else type_config.weight
             min_rating_diff = 0 if type_config.min_rating_diff is None else type_config.min_rating_diff
             max_rating_diff = 10_000 if type_config.max_rating_diff is None else type_config.max_rating_diff
 
-            matchmaking_types.append(Matchmaking_Type(name, initial_time, increment, rated, variant,
-                                                      perf_type, multiplier, weight, min_rating_diff, max_rating_diff))
+            matchmaking_types.append(Matchmaking_Type(name, type_config.initial_time, type_config.increment, rated,
+                                                      variant, perf_type, multiplier, weight, min_rating_diff,
+                                                      max_rating_diff))
 
         perf_type_count = len({matchmaking_type.perf_type for matchmaking_type in matchmaking_types})
         for matchmaking_type, type_config in zip(matchmaking_types, self.config.matchmaking.types.values()):
@@ -177,7 +175,7 @@ class Matchmaking:
 
             rating_diffs: dict[Perf_Type, int] = {}
             for perf_type in Perf_Type:
-                bot_rating = bot['perfs'][perf_type.value]['rating'] if perf_type.value in bot['perfs'] else 1500
+                bot_rating = bot['perfs'][perf_type]['rating'] if perf_type in bot['perfs'] else 1500
                 rating_diffs[perf_type] = bot_rating - user_ratings[perf_type]
 
             online_bots.append(Bot(bot['username'], tos_violation, rating_diffs))
@@ -194,8 +192,8 @@ class Matchmaking:
 
         performances: dict[Perf_Type, int] = {}
         for perf_type in Perf_Type:
-            if perf_type.value in user['perfs']:
-                performances[perf_type] = user['perfs'][perf_type.value]['rating']
+            if perf_type in user['perfs']:
+                performances[perf_type] = user['perfs'][perf_type]['rating']
             else:
                 performances[perf_type] = 2500
 
@@ -203,7 +201,7 @@ class Matchmaking:
 
     def _variant_to_perf_type(self, variant: Variant, initial_time: int, increment: int) -> Perf_Type:
         if variant != Variant.STANDARD:
-            return Perf_Type(variant.value)
+            return Perf_Type(variant)
 
         estimated_game_duration = initial_time + increment * 40
         if estimated_game_duration < 179:
@@ -221,7 +219,7 @@ class Matchmaking:
         if perf_type in [Perf_Type.BULLET, Perf_Type.BLITZ, Perf_Type.RAPID, Perf_Type.CLASSICAL]:
             return Variant.STANDARD
 
-        return Variant(perf_type.value)
+        return Variant(perf_type)
 
     async def _get_busy_reason(self, bot: Bot) -> Busy_Reason | None:
         bot_status = await self.api.get_user_status(bot.username)
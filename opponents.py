@@ -29,7 +29,7 @@ class Matchmaking_Data:
             dict_['multiplier'] = self.multiplier
 
         if self.color == Challenge_Color.BLACK:
-            dict_['color'] = Challenge_Color.BLACK.value
+            dict_['color'] = Challenge_Color.BLACK
 
         return dict_
 
@@ -57,7 +57,7 @@ class Opponent:
         dict_: dict[str, str | dict] = {'username': self.username}
         for perf_type, matchmaking_data in self.data.items():
             if matchmaking_data_dict := matchmaking_data.to_dict():
-                dict_[perf_type.value] = matchmaking_data_dict
+                dict_[perf_type] = matchmaking_data_dict
 
         return dict_ if len(dict_) > 1 else {}
 
@@ -4,7 +4,7 @@ import logging
 import os
 import signal
 import sys
-from enum import Enum
+from enum import StrEnum
 from typing import TypeVar
 
 from api import API
@@ -35,7 +35,7 @@ COMMANDS = {
     'whitelist': 'Temporarily whitelists a user. Use config for permanent whitelisting. Usage: whitelist USERNAME'
 }
 
-EnumT = TypeVar('EnumT', bound=Enum)
+EnumT = TypeVar('EnumT', bound=StrEnum)
 
 
 class User_Interface:
@@ -144,7 +144,7 @@ class User_Interface:
             print(COMMANDS['blacklist'])
             return
 
-        self.config.blacklist.append(command[1].lower())
+        self.config.blacklist.add(command[1].lower())
         print(f'Added {command[1]} to the blacklist.')
 
     def _challenge(self, command: list[str]) -> None:
@@ -267,7 +267,7 @@ class User_Interface:
             print(COMMANDS['whitelist'])
             return
 
-        self.config.whitelist.append(command[1].lower())
+        self.config.whitelist.add(command[1].lower())
         print(f'Added {command[1]} to the whitelist.')
 
     def _help(self) -> None:
@@ -277,7 +277,7 @@ class User_Interface:
 
     def _find_enum(self, name: str, enum_type: type[EnumT]) -> EnumT:
         for enum in enum_type:
-            if enum.value.lower() == name.lower():
+            if enum.lower() == name.lower():
                 return enum
 
         raise ValueError(f'{name} is not a valid {enum_type}')